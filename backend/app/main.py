@@ -2,9 +2,7 @@ from fastapi import FastAPI, UploadFile, File, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from ultralytics import YOLO
 import cv2
-import numpy as np
 import base64
 from PIL import Image
 import io
@@ -15,6 +13,8 @@ import pandas as pd
 import datetime as dt
 import queue
 
+from inference import PREVIEW_SIZE, Classifier, Detector, decode_reduced, fit_preview
+
 # Try to import picamera2, fallback to None if not available
 try:
     from picamera2 import Picamera2
@@ -96,72 +96,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load YOLO model
-model = YOLO("../disease.pt")
-matmodel = YOLO("../nano.pt")
+# Load YOLO models (shared through the inference registry)
+classifier = Classifier("../disease.pt", min_score=0.3, conf=0.3)
+detector = Detector("../nano.pt", min_score=0.7)
 
 # Initialize camera
 camera = Camera()
 
 def process_frame(frame):
     # Process the frame using the disease classification model
-    results = model.predict(frame, conf=0.3)  # Use appropriate confidence threshold
-    classifications = []
-
-    for result in results:
-        # Use `result.probs.top1` for the top class and `result.probs.top1conf` for confidence
-        class_id = result.probs.top1  # Top-1 class index
-        confidence = result.probs.top1conf  # Confidence score for the top-1 class
-        label = result.names[class_id] if class_id in result.names else "Unknown"
-
-        if confidence < 0.3:  # Skip low-confidence predictions
-            continue
-
-        classifications.append({
-            "label": label,
-            "confidence": float(confidence),  # Convert to float for JSON serialization
-        })
+    top = classifier.predict(frame)
+    classifications = [top.to_dict()] if top is not None else []
 
     return frame, classifications
 
-def process_framed(frame):
-    results = matmodel(frame)
-    detections = []
-    premature = 0
-    potential = 0  
-    mature = 0
-
-    for result in results:
-        for box in result.boxes:
-            class_id = int(box.cls[0])
-            score = float(box.conf[0])
-            label = result.names[class_id] if class_id in result.names else "Unknown"
-
-            if label == 'Premature':
-                premature += 1
-            elif label == 'Potential':
-                potential += 1 
-            elif label == 'Mature':
-                mature += 1
-
-            if score < 0.7:
-                continue
-
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
-
-            # Draw rectangle and label on the frame
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            label_text = f"{label}: {score:.2f}"
-            cv2.putText(frame, label_text, (x1, y1 - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+def process_framed(frame, scale=1.0):
+    # scale maps frame pixels to the coordinates reported in "bbox"
+    found = detector.predict(frame)
+    counts = found.counts()
+    premature = counts.get('Premature', 0)
+    potential = counts.get('Potential', 0)
+    mature = counts.get('Mature', 0)
 
-            detections.append({
-                "label": label,
-                "confidence": score,
-                "bbox": [x1, y1, x2, y2]
-            })
+    # Draw rectangle and label on the frame
+    kept = found.above(detector.min_score)
+    kept.draw(frame)
 
-    return frame, detections, premature, potential, mature
+    return frame, kept.scaled(scale).to_list(), premature, potential, mature
 
 
 def frame_to_base64(framed):
@@ -251,14 +212,15 @@ async def upload_image(
 ):
     # Read and process the uploaded image
     contents = await file.read()
-    nparr = np.frombuffer(contents, np.uint8)
-    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode at reduced scale and shrink to the preview that is returned;
+    # the classifier does its own short-side resize and center-crop
+    size = max(classifier.input_size, PREVIEW_SIZE)
+    img, _ = decode_reduced(contents, size)
 
     if img is None:
         return {"error": "Invalid image file"}
 
-    # Resize image
-    img = cv2.resize(img, (640, 360))
+    img, _ = fit_preview(img, size)
 
     # Process the frame
     processed_frame, classifications = process_frame(img)
@@ -286,17 +248,18 @@ async def upload_image(
 
     # Read and process the uploaded image
     contents = await file.read()
-    nparr = np.frombuffer(contents, np.uint8)
-    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode at reduced scale and shrink to the preview that is returned;
+    # the detector letterboxes it once into its input buffer
+    size = max(detector.input_size, PREVIEW_SIZE)
+    img, scale = decode_reduced(contents, size)
 
     if img is None:
         return {"error": "Invalid image file"}
 
-    # Resize image
-    img = cv2.resize(img, (640, 360))
+    img, fit = fit_preview(img, size)
 
     # Process the frame
-    processed_frame, detections, premature, potential, mature = process_framed(img)
+    processed_frame, detections, premature, potential, mature = process_framed(img, scale * fit)
 
     # Convert processed frame to base64 for frontend display
     base64_image = frame_to_base64(processed_frame)
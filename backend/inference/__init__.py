@@ -0,0 +1,19 @@
+from .predictor import Classifier, Detector
+from .preprocess import PREVIEW_SIZE, Letterbox, decode_reduced, fit_preview, load_reduced
+from .registry import ModelRegistry, get_model, registry
+from .results import Classification, Detections
+
+__all__ = [
+    "PREVIEW_SIZE",
+    "Classification",
+    "Classifier",
+    "Detections",
+    "Detector",
+    "Letterbox",
+    "ModelRegistry",
+    "decode_reduced",
+    "fit_preview",
+    "get_model",
+    "load_reduced",
+    "registry",
+]
@@ -0,0 +1,79 @@
+import threading
+
+from .preprocess import Letterbox, align_to_stride
+from .registry import registry
+from .results import Classification, Detections
+
+DEFAULT_IMGSZ = 640
+
+
+def _model_imgsz(model):
+    # Input size the weights were trained at, as saved in the checkpoint args
+    imgsz = model.overrides.get("imgsz", DEFAULT_IMGSZ)
+    if isinstance(imgsz, (list, tuple)):
+        imgsz = max(imgsz)
+    return int(imgsz)
+
+
+class _Predictor:
+    def __init__(self, weights, min_score, conf=None, imgsz=None):
+        self.model = registry.get(weights)
+        self._model_lock = registry.predict_lock(weights)
+        self.min_score = min_score
+        self.conf = conf
+        # ultralytics rounds imgsz up to the stride anyway, do it here so Letterbox agrees
+        self.input_size = align_to_stride(imgsz or _model_imgsz(self.model))
+
+    def _predict(self, frames):
+        kwargs = {"verbose": False, "imgsz": self.input_size}
+        if self.conf is not None:
+            kwargs["conf"] = self.conf
+        with self._model_lock:
+            return self.model.predict(list(frames), **kwargs)
+
+
+class Detector(_Predictor):
+    """Object detector; min_score is the cut-off for boxes that get drawn and reported.
+
+    Frames are letterboxed into reused buffers (long side input_size, short side
+    stride-aligned) before prediction and the boxes come back in the coordinates of
+    the frames that were passed in.
+    """
+
+    def __init__(self, weights, min_score=0.7, conf=None, imgsz=None):
+        super().__init__(weights, min_score, conf=conf, imgsz=imgsz)
+        self._letterbox = Letterbox(self.input_size)
+        self._lock = threading.Lock()
+
+    def predict_batch(self, frames):
+        frames = list(frames)
+        # The letterbox buffers are reused, so one batch at a time per Detector
+        with self._lock:
+            inputs, transforms = self._letterbox(frames)
+            results = self._predict(inputs)
+            found = [Detections.from_result(r) for r in results]
+        return [
+            dets.unletterbox(ratio, pad, frame.shape)
+            for dets, (ratio, pad), frame in zip(found, transforms, frames)
+        ]
+
+    def predict(self, frame):
+        return self.predict_batch([frame])[0]
+
+
+class Classifier(_Predictor):
+    """Image classifier; predictions below min_score are dropped."""
+
+    def __init__(self, weights, min_score=0.3, conf=None, imgsz=None):
+        super().__init__(weights, min_score, conf=conf, imgsz=imgsz)
+
+    def predict_batch(self, frames):
+        # None where the top-1 confidence is below min_score
+        predictions = []
+        for result in self._predict(frames):
+            top = Classification.from_result(result)
+            predictions.append(top if top.confidence >= self.min_score else None)
+        return predictions
+
+    def predict(self, frame):
+        return self.predict_batch([frame])[0]
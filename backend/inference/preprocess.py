@@ -0,0 +1,138 @@
+import io
+
+import cv2
+import numpy as np
+from PIL import Image
+
+PAD_VALUE = 114
+STRIDE = 32
+
+# Long side of the upload images the entry points draw on, return and save
+PREVIEW_SIZE = 640
+
+# Largest first so we pick the cheapest decode that is still big enough
+_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def _header_size(data):
+    # PIL only parses the header here, the pixels are never decoded
+    try:
+        with Image.open(io.BytesIO(data)) as im:
+            return im.size
+    except Exception:
+        return None
+
+
+def decode_reduced(data, min_long_side):
+    """Decode image bytes at the smallest power-of-two reduction whose long side
+    is still at least min_long_side. JPEGs are scaled during DCT decoding so the
+    full-size image is never allocated.
+
+    Returns (image, factor) where factor maps decoded pixels back to the original
+    image (original = decoded * factor), or (None, 1.0) for unreadable data.
+    """
+    buf = np.frombuffer(data, np.uint8)
+    size = _header_size(data)
+
+    flag = cv2.IMREAD_COLOR
+    if size is not None:
+        long_side = max(size)
+        for reduction, reduced_flag in _REDUCED_FLAGS:
+            if long_side // reduction >= min_long_side:
+                flag = reduced_flag
+                break
+
+    img = cv2.imdecode(buf, flag)
+    if img is None:
+        return None, 1.0
+    if size is None:
+        return img, 1.0
+    # max() of both sides so EXIF rotation applied by imdecode does not matter
+    return img, max(size) / max(img.shape[:2])
+
+
+def load_reduced(path, min_long_side):
+    with open(path, "rb") as f:
+        return decode_reduced(f.read(), min_long_side)
+
+
+def fit_preview(img, long_side=PREVIEW_SIZE):
+    """Shrink img so its long side is at most long_side, keeping the aspect ratio.
+
+    Returns (image, factor) where factor maps preview pixels back to img
+    (img = preview * factor).
+    """
+    h, w = img.shape[:2]
+    ratio = long_side / max(h, w)
+    if ratio >= 1:
+        return img, 1.0
+    nw, nh = round(w * ratio), round(h * ratio)
+    preview = cv2.resize(img, (nw, nh), interpolation=cv2.INTER_AREA)
+    return preview, max(h, w) / max(nh, nw)
+
+
+def align_to_stride(n, stride=STRIDE):
+    return -(-n // stride) * stride
+
+
+class Letterbox:
+    """Scales images so the long side is imgsz and pads the short side up to the model
+    stride, the same shape ultralytics' own rect letterbox produces, so the model has
+    nothing left to resize or pad.
+
+    Buffers are allocated once per output shape and reused across calls.
+    """
+
+    def __init__(self, imgsz, stride=STRIDE):
+        self.imgsz = align_to_stride(imgsz, stride)
+        self.stride = stride
+        self._buffers = {}
+
+    def _buffer(self, shape, index):
+        pool = self._buffers.setdefault(shape, [])
+        if len(pool) <= index:
+            pool.append(np.full((*shape, 3), PAD_VALUE, dtype=np.uint8))
+        return pool[index]
+
+    def _fit(self, img, out, ratio, nw, nh):
+        h, w = img.shape[:2]
+        bh, bw = out.shape[:2]
+        left, top = (bw - nw) // 2, (bh - nh) // 2
+
+        region = out[top:top + nh, left:left + nw]
+        if (nh, nw) == (h, w):
+            region[...] = img
+        else:
+            resized = cv2.resize(img, (nw, nh), dst=region, interpolation=cv2.INTER_LINEAR)
+            if not np.shares_memory(resized, out):
+                region[...] = resized
+
+        # Only the border needs resetting, the previous image may have covered it
+        out[:top] = PAD_VALUE
+        out[top + nh:] = PAD_VALUE
+        out[top:top + nh, :left] = PAD_VALUE
+        out[top:top + nh, left + nw:] = PAD_VALUE
+        return ratio, (left, top)
+
+    def __call__(self, images):
+        """Letterbox a list of BGR images.
+
+        Returns the buffers and a (ratio, (pad_x, pad_y)) pair per image for
+        mapping boxes back with Detections.unletterbox().
+        """
+        buffers, transforms, used = [], [], {}
+        for img in images:
+            h, w = img.shape[:2]
+            ratio = self.imgsz / max(h, w)
+            nw, nh = min(self.imgsz, round(w * ratio)), min(self.imgsz, round(h * ratio))
+            shape = (align_to_stride(nh, self.stride), align_to_stride(nw, self.stride))
+            index = used.get(shape, 0)
+            used[shape] = index + 1
+            out = self._buffer(shape, index)
+            buffers.append(out)
+            transforms.append(self._fit(img, out, ratio, nw, nh))
+        return buffers, transforms
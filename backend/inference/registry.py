@@ -0,0 +1,39 @@
+import os
+import threading
+
+from ultralytics import YOLO
+
+
+class ModelRegistry:
+    """Loads each weights file once and hands out the shared YOLO instance.
+
+    Each model comes with a lock; the YOLO predictor keeps per-call state, so every
+    wrapper sharing the model must hold it while predicting.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._predict_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, weights):
+        key = os.path.abspath(weights)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = YOLO(weights)
+                self._models[key] = model
+                self._predict_locks[key] = threading.Lock()
+        return model
+
+    def predict_lock(self, weights):
+        self.get(weights)
+        return self._predict_locks[os.path.abspath(weights)]
+
+
+# Shared by every entry point in the process
+registry = ModelRegistry()
+
+
+def get_model(weights):
+    return registry.get(weights)
@@ -0,0 +1,114 @@
+import cv2
+import numpy as np
+
+BOX_COLOR = (0, 255, 0)
+TEXT_COLOR = (255, 0, 0)
+
+
+def _label_for(names, class_id):
+    return names[class_id] if class_id in names else "Unknown"
+
+
+class Detections:
+    """Boxes found in one image, kept as parallel numpy arrays instead of per-box objects."""
+
+    __slots__ = ("xyxy", "conf", "cls", "names")
+
+    def __init__(self, xyxy, conf, cls, names):
+        self.xyxy = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4)
+        self.conf = np.asarray(conf, dtype=np.float32).reshape(-1)
+        self.cls = np.asarray(cls, dtype=np.int16).reshape(-1)
+        self.names = names
+
+    @classmethod
+    def from_result(cls, result):
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return cls(np.empty((0, 4)), np.empty(0), np.empty(0), result.names)
+        return cls(
+            boxes.xyxy.cpu().numpy(),
+            boxes.conf.cpu().numpy(),
+            boxes.cls.cpu().numpy(),
+            result.names,
+        )
+
+    def __len__(self):
+        return len(self.conf)
+
+    def label(self, i):
+        return _label_for(self.names, int(self.cls[i]))
+
+    def above(self, min_score):
+        # Returns a new Detections holding only boxes scoring at least min_score
+        keep = self.conf >= min_score
+        return Detections(self.xyxy[keep], self.conf[keep], self.cls[keep], self.names)
+
+    def unletterbox(self, ratio, pad, shape):
+        # Undo Letterbox: boxes go from model-input pixels to pixels of the image of given shape
+        xyxy = self.xyxy.copy()
+        xyxy[:, [0, 2]] -= pad[0]
+        xyxy[:, [1, 3]] -= pad[1]
+        xyxy /= ratio
+        h, w = shape[:2]
+        xyxy[:, [0, 2]] = np.clip(xyxy[:, [0, 2]], 0, w)
+        xyxy[:, [1, 3]] = np.clip(xyxy[:, [1, 3]], 0, h)
+        return Detections(xyxy, self.conf, self.cls, self.names)
+
+    def scaled(self, factor):
+        return Detections(self.xyxy * factor, self.conf, self.cls, self.names)
+
+    def counts(self):
+        counts = {}
+        if len(self) == 0:
+            return counts
+        for class_id, n in enumerate(np.bincount(self.cls)):
+            if n:
+                counts[_label_for(self.names, class_id)] = int(n)
+        return counts
+
+    def boxes(self):
+        # Rounded rather than truncated, boxes mapped back from the letterbox are fractional
+        return np.rint(self.xyxy).astype(np.int32)
+
+    def draw(self, frame):
+        for i, ((x1, y1, x2, y2), score) in enumerate(zip(self.boxes().tolist(), self.conf.tolist())):
+            cv2.rectangle(frame, (x1, y1), (x2, y2), BOX_COLOR, 2)
+            label_text = f"{self.label(i)}: {score:.2f}"
+            cv2.putText(frame, label_text, (x1, y1 - 10),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, TEXT_COLOR, 2)
+        return frame
+
+    def to_list(self):
+        return [
+            {
+                "label": self.label(i),
+                "confidence": score,
+                "bbox": bbox,
+            }
+            for i, (bbox, score) in enumerate(zip(self.boxes().tolist(), self.conf.tolist()))
+        ]
+
+
+class Classification:
+    """Top-1 class of one image from a classification model."""
+
+    __slots__ = ("class_id", "confidence", "names")
+
+    def __init__(self, class_id, confidence, names):
+        self.class_id = int(class_id)
+        self.confidence = float(confidence)
+        self.names = names
+
+    @classmethod
+    def from_result(cls, result):
+        return cls(result.probs.top1, result.probs.top1conf, result.names)
+
+    @property
+    def label(self):
+        return _label_for(self.names, self.class_id)
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "confidence": self.confidence,
+        }
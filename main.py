@@ -1,13 +1,16 @@
 import cv2
-from ultralytics import YOLO
 import tkinter as tk
 from tkinter import Label, Button, Entry, filedialog
 from PIL import Image, ImageTk
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from inference import PREVIEW_SIZE, Detector, fit_preview, load_reduced
 
 # Load YOLO model (on local machine) coconute dataset
-model = YOLO("best5.pt")
+detector = Detector("best5.pt", min_score=0.7)
 
 # Initialize camera variable
 cap = None
@@ -15,20 +18,7 @@ running = False
 
 # Function to detect hands and render them
 def detect_hands(frame):
-    results = model(frame)
-    
-    for result in results:
-        for box in result.boxes:
-            class_id = int(box.cls[0])
-            score = float(box.conf[0])
-            label = result.names[class_id] if class_id in result.names else "Unknown"
-
-            if score < 0.7:
-                continue
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            label_text = f"{label}: {score:.2f}"
-            cv2.putText(frame, label_text, (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+    detector.predict(frame).above(detector.min_score).draw(frame)
 
     return frame
 
@@ -77,19 +67,7 @@ def save_frame():
     ret, frame = cap.read()
     if ret:
       # Detect objects and draw annotations
-      results = model(frame)
-      for result in results:
-        for box in result.boxes:
-          class_id = int(box.cls[0])
-          score = float(box.conf[0])
-          label = result.names[class_id] if class_id in result.names else "Unknown"
-
-          if score < 0.7:
-            continue
-          x1, y1, x2, y2 = map(int, box.xyxy[0])
-          cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-          label_text = f"{label}: {score:.2f}"
-          cv2.putText(frame, label_text, (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+      frame = detect_hands(frame)
 
       # Save the annotated image
       folder_path = "saved_frames"
@@ -102,9 +80,11 @@ def save_frame():
 def upload_image():
     file_path = filedialog.askopenfilename()
     if file_path:
-        frame = cv2.imread(file_path)
+        # Decode at reduced scale and shrink to the preview that is shown and saved
+        size = max(detector.input_size, PREVIEW_SIZE)
+        frame, _ = load_reduced(file_path, size)
         if frame is not None:
-            frame = cv2.resize(frame, (640, 360))
+            frame, _ = fit_preview(frame, size)
             frame = detect_hands(frame)
 
             # Extract color features
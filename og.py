@@ -2,18 +2,20 @@ from fastapi import FastAPI, UploadFile, File, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from ultralytics import YOLO
 import cv2
-import numpy as np
 import base64
 from PIL import Image
 import io
 import os
 from typing import Optional
 import json
+import sys
 import picamera2
 from picamera2 import Picamera2
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from inference import PREVIEW_SIZE, Detector, decode_reduced, fit_preview
+
 app = FastAPI()
 
 # For debugging purposes
@@ -32,41 +34,21 @@ app.add_middleware(
 )
 
 # Load YOLO model
-model = YOLO("../best5.pt")
+detector = Detector("../best5.pt", min_score=0.7)
 
 # Initialize Pi Camera
 picam2 = Picamera2()
 preview_config = picam2.create_preview_configuration(main={"size": (640, 360)})
 picam2.configure(preview_config)
 
-def process_frame(frame):
-    results = model(frame)
-    detections = []
-    
-    for result in results:
-        for box in result.boxes:
-            class_id = int(box.cls[0])
-            score = float(box.conf[0])
-            label = result.names[class_id] if class_id in result.names else "Unknown"
-            
-            if score < 0.7:
-                continue
-                
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
-            
-            # Draw rectangle and label on the frame
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            label_text = f"{label}: {score:.2f}"
-            cv2.putText(frame, label_text, (x1, y1 - 10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-            
-            detections.append({
-                "label": label,
-                "confidence": score,
-                "bbox": [x1, y1, x2, y2]
-            })
-    
-    return frame, detections
+def process_frame(frame, scale=1.0):
+    # scale maps frame pixels to the coordinates reported in "bbox"
+    detections = detector.predict(frame).above(detector.min_score)
+
+    # Draw rectangle and label on the frame
+    detections.draw(frame)
+
+    return frame, detections.scaled(scale).to_list()
 
 def frame_to_base64(frame):
     _, buffer = cv2.imencode('.jpg', frame)
@@ -84,17 +66,18 @@ async def upload_image(
 ):
     # Read and process the uploaded image
     contents = await file.read()
-    nparr = np.frombuffer(contents, np.uint8)
-    img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode at reduced scale and shrink to the preview that is saved and returned;
+    # the detector letterboxes it once into its input buffer
+    size = max(detector.input_size, PREVIEW_SIZE)
+    img, scale = decode_reduced(contents, size)
     
     if img is None:
         return {"error": "Invalid image file"}
     
-    # Resize image
-    img = cv2.resize(img, (640, 360))
+    img, fit = fit_preview(img, size)
     
     # Process the frame
-    processed_frame, detections = process_frame(img)
+    processed_frame, detections = process_frame(img, scale * fit)
     
     # Save the processed image
     save_dir = "uploaded_images"